@@ -203,8 +203,8 @@ subject: "Re: {DEMO_EMAIL['subject']}"
         print("  Please approve the pending item in the web UI, then press Enter...")
 
         import uvicorn
-        from src.web import create_app, app
-        create_app(vault)
+        from src.web import create_app
+        app = create_app(vault)
         server_thread = threading.Thread(
             target=lambda: uvicorn.run(app, host="0.0.0.0", port=8000, log_level="warning"),
             daemon=True,
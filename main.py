@@ -21,11 +21,11 @@ def start_web_dashboard(vault_path: Path, port: int, logger: logging.Logger):
     import uvicorn
     from src.web import create_app
 
-    create_app(vault_path)
+    app = create_app(vault_path)
     logger.info(f"Web dashboard starting at http://localhost:{port}")
 
     config = uvicorn.Config(
-        "src.web:app",
+        app,
         host="0.0.0.0",
         port=port,
         log_level="warning",
@@ -0,0 +1,162 @@
+"""Tool implementations for the social media MCP server.
+
+Plain functions with no MCP dependency — social_server.py wraps them
+with FastMCP, and unit tests import them from here directly without
+paying the MCP protocol stack's import cost.
+"""
+import json
+import logging
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.social import (
+    LinkedInPoster,
+    FacebookPoster,
+    InstagramPoster,
+    TwitterPoster,
+    create_social_post_draft,
+    generate_social_summary,
+)
+from src.utils import log_action
+
+logger = logging.getLogger("mcp.social_server")
+
+# Vault path from environment
+VAULT_PATH = Path(os.getenv("VAULT_PATH", "./vault")).resolve()
+
+
+def post_to_linkedin(content: str) -> str:
+    """Post content to LinkedIn.
+
+    Args:
+        content: The text content to post to LinkedIn.
+    """
+    logs_dir = VAULT_PATH / "Logs"
+    poster = LinkedInPoster()
+    result = poster.post(content)
+
+    if result.get("success"):
+        log_action(
+            logs_dir=logs_dir,
+            actor="mcp_social_server",
+            action="social_posted",
+            source="mcp_tool",
+            result=f"linkedin:{content[:50]}",
+        )
+
+    return json.dumps(result)
+
+
+def post_to_facebook(content: str) -> str:
+    """Post content to Facebook.
+
+    Args:
+        content: The text content to post to Facebook.
+    """
+    logs_dir = VAULT_PATH / "Logs"
+    poster = FacebookPoster()
+    result = poster.post(content)
+
+    if result.get("success"):
+        log_action(
+            logs_dir=logs_dir,
+            actor="mcp_social_server",
+            action="social_posted",
+            source="mcp_tool",
+            result=f"facebook:{content[:50]}",
+        )
+
+    return json.dumps(result)
+
+
+def post_to_instagram(content: str, image_url: str) -> str:
+    """Post content to Instagram (requires an image URL).
+
+    Args:
+        content: The caption text for the Instagram post (max 2200 chars).
+        image_url: URL of the image to post.
+    """
+    logs_dir = VAULT_PATH / "Logs"
+    poster = InstagramPoster()
+    result = poster.post(content, image_url=image_url)
+
+    if result.get("success"):
+        log_action(
+            logs_dir=logs_dir,
+            actor="mcp_social_server",
+            action="social_posted",
+            source="mcp_tool",
+            result=f"instagram:{content[:50]}",
+        )
+
+    return json.dumps(result)
+
+
+def post_to_twitter(content: str) -> str:
+    """Post content to Twitter/X (280 character limit, auto-truncated).
+
+    Args:
+        content: The text content to post to Twitter (max 280 chars).
+    """
+    logs_dir = VAULT_PATH / "Logs"
+    poster = TwitterPoster()
+    result = poster.post(content)
+
+    if result.get("success"):
+        log_action(
+            logs_dir=logs_dir,
+            actor="mcp_social_server",
+            action="social_posted",
+            source="mcp_tool",
+            result=f"twitter:{content[:50]}",
+        )
+
+    return json.dumps(result)
+
+
+def create_draft_post(platform: str, content: str) -> str:
+    """Create a draft social media post in Pending_Approval/ for human review.
+
+    Args:
+        platform: Target platform (linkedin, facebook, twitter).
+        content: The text content for the social media post.
+    """
+    try:
+        path = create_social_post_draft(VAULT_PATH, platform, content)
+        log_action(
+            logs_dir=VAULT_PATH / "Logs",
+            actor="mcp_social_server",
+            action="social_draft_created",
+            source="mcp_tool",
+            result=f"{platform}:{path.name}",
+        )
+        return json.dumps({
+            "success": True,
+            "platform": platform,
+            "draft_path": str(path),
+            "message": f"Draft created for {platform}. Review in Pending_Approval/.",
+        })
+    except Exception as e:
+        return json.dumps({
+            "success": False,
+            "error": str(e),
+        })
+
+
+def get_social_summary() -> str:
+    """Get a summary of social media posting activity for the past 7 days."""
+    try:
+        summary = generate_social_summary(VAULT_PATH, period_days=7)
+        return json.dumps({
+            "success": True,
+            "summary": summary,
+        })
+    except Exception as e:
+        return json.dumps({
+            "success": False,
+            "error": str(e),
+        })
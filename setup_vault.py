@@ -1,4 +1,5 @@
 """One-time Obsidian vault initialization."""
+import os
 from pathlib import Path
 
 VAULT_FOLDERS = ["Inbox", "Needs_Action", "Plans", "Pending_Approval", "Approved", "Done", "Logs", "Incoming_Files", "Rejected", "Briefings", "Quarantine", "In_Progress", "Updates"]
@@ -77,21 +78,25 @@ DOMAINS = ["email", "file", "social"]
 
 def setup_vault(vault_path: Path) -> None:
     vault_path.mkdir(parents=True, exist_ok=True)
+    # One scandir tells us what already exists — on an initialized vault
+    # (every scheduler start) the mkdir/exists probes below all skip.
+    existing = {entry.name for entry in os.scandir(vault_path)}
     for folder in VAULT_FOLDERS:
-        (vault_path / folder).mkdir(exist_ok=True)
+        if folder not in existing:
+            (vault_path / folder).mkdir()
     # Create domain-specific subdirectories (Platinum tier)
     for folder in DOMAIN_FOLDERS:
+        base = vault_path / folder
+        sub_existing = {entry.name for entry in os.scandir(base)}
         for domain in DOMAINS:
-            (vault_path / folder / domain).mkdir(parents=True, exist_ok=True)
-    handbook = vault_path / "Company_Handbook.md"
-    if not handbook.exists():
-        handbook.write_text(DEFAULT_HANDBOOK)
-    agent_memory = vault_path / "Agent_Memory.md"
-    if not agent_memory.exists():
-        agent_memory.write_text(DEFAULT_AGENT_MEMORY)
-    dashboard = vault_path / "Dashboard.md"
-    if not dashboard.exists():
-        dashboard.write_text(DEFAULT_DASHBOARD)
+            if domain not in sub_existing:
+                (base / domain).mkdir()
+    if "Company_Handbook.md" not in existing:
+        (vault_path / "Company_Handbook.md").write_text(DEFAULT_HANDBOOK)
+    if "Agent_Memory.md" not in existing:
+        (vault_path / "Agent_Memory.md").write_text(DEFAULT_AGENT_MEMORY)
+    if "Dashboard.md" not in existing:
+        (vault_path / "Dashboard.md").write_text(DEFAULT_DASHBOARD)
 
 
 if __name__ == "__main__":
@@ -14,6 +14,8 @@ import time
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
 
+from src.utils import read_log_entries
+
 logger = logging.getLogger("digital_fte.briefing")
 
 # Action types mapped to stat keys
@@ -57,8 +59,10 @@ def get_period_stats(vault_path: Path, period_days: int = 7) -> dict:
 
     cutoff = datetime.now(timezone.utc) - timedelta(days=period_days)
 
-    for log_file in sorted(logs_dir.glob("*.json")):
-        # Parse the date from the filename (YYYY-MM-DD.json)
+    # *.json picks up pre-NDJSON history; non-daily names (e.g. the Ralph
+    # iteration logs) fail the date parse below and are skipped.
+    for log_file in sorted(logs_dir.glob("*.json*")):
+        # Parse the date from the filename (YYYY-MM-DD.jsonl)
         try:
             file_date_str = log_file.stem  # e.g. "2026-02-17"
             file_date = datetime.strptime(file_date_str, "%Y-%m-%d").replace(tzinfo=timezone.utc)
@@ -70,7 +74,7 @@ def get_period_stats(vault_path: Path, period_days: int = 7) -> dict:
             continue
 
         try:
-            entries = json.loads(log_file.read_text(encoding="utf-8"))
+            entries = read_log_entries(log_file)
         except (json.JSONDecodeError, OSError):
             continue
 
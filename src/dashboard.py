@@ -1,8 +1,11 @@
 """Dashboard.md generator — produces a real-time vault summary for Obsidian."""
 import json
+import re
 from datetime import datetime, timezone
 from pathlib import Path
 
+from src.utils import read_log_entries
+
 # Folders to include in the vault overview table (in display order).
 OVERVIEW_FOLDERS = [
     "Inbox",
@@ -23,6 +26,9 @@ ACTIVE_FOLDERS = ["Inbox", "Needs_Action", "Pending_Approval", "Approved"]
 
 MAX_RECENT_ENTRIES = 10
 
+# Daily logs are YYYY-MM-DD.jsonl; .json covers pre-NDJSON history.
+_DAILY_LOG_RE = re.compile(r"^\d{4}-\d{2}-\d{2}\.jsonl?$")
+
 
 def _count_files(folder: Path) -> int:
     """Return the number of files (not dirs) in *folder* and subdirs, 0 if missing."""
@@ -37,10 +43,10 @@ def _items_to_process(vault_path: Path) -> int:
 
 
 def _latest_log_file(logs_dir: Path) -> Path | None:
-    """Return the most recent JSON log file, or None."""
+    """Return the most recent daily log file, or None."""
     if not logs_dir.is_dir():
         return None
-    log_files = sorted(logs_dir.glob("*.json"))
+    log_files = sorted(f for f in logs_dir.iterdir() if _DAILY_LOG_RE.match(f.name))
     return log_files[-1] if log_files else None
 
 
@@ -50,19 +56,23 @@ def _recent_activity(vault_path: Path) -> list[dict]:
     if log_file is None:
         return []
     try:
-        entries = json.loads(log_file.read_text(encoding="utf-8"))
+        entries = read_log_entries(log_file)
     except (json.JSONDecodeError, OSError):
         return []
     return entries[-MAX_RECENT_ENTRIES:]
 
 
 def _pending_approvals(vault_path: Path) -> list[tuple[str, str]]:
-    """Return (filename, created_date) pairs for Pending_Approval/ files."""
+    """Return (filename, created_date) pairs for Pending_Approval/ .md files.
+
+    Only markdown files count as approval items — the same predicate the
+    web dashboard's empty-folder probe uses.
+    """
     pa_dir = vault_path / "Pending_Approval"
     if not pa_dir.is_dir():
         return []
     results = []
-    for f in sorted(pa_dir.iterdir()):
+    for f in sorted(pa_dir.glob("*.md")):
         if f.is_file():
             created = datetime.fromtimestamp(
                 f.stat().st_mtime, tz=timezone.utc
@@ -2,6 +2,7 @@
 import base64
 import json
 import logging
+import threading
 from datetime import datetime, timezone
 from email.mime.text import MIMEText
 from pathlib import Path
@@ -44,13 +45,21 @@ def send_reply(gmail_service, gmail_id: str, to: str, subject: str, body: str) -
     return result
 
 
+# Serializes the daily send counter's read-modify-write. Reentrant so a
+# caller can hold it across a check_send_limit + increment_send_count
+# pair — the scheduler runs send-capable stages on separate threads, and
+# the limit is a safety guardrail that must not be racy.
+SEND_LIMIT_LOCK = threading.RLock()
+
+
 def check_send_limit(logs_dir: Path, limit: int) -> bool:
     """Return True if under the daily send limit, False if at/over."""
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
     count_file = logs_dir / f".send_count_{today}.json"
-    if not count_file.exists():
-        return 0 < limit
-    data = json.loads(count_file.read_text())
+    with SEND_LIMIT_LOCK:
+        if not count_file.exists():
+            return 0 < limit
+        data = json.loads(count_file.read_text())
     return data.get("count", 0) < limit
 
 
@@ -59,10 +68,11 @@ def increment_send_count(logs_dir: Path) -> int:
     logs_dir.mkdir(parents=True, exist_ok=True)
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
     count_file = logs_dir / f".send_count_{today}.json"
-    count = 0
-    if count_file.exists():
-        data = json.loads(count_file.read_text())
-        count = data.get("count", 0)
-    count += 1
-    count_file.write_text(json.dumps({"count": count}))
+    with SEND_LIMIT_LOCK:
+        count = 0
+        if count_file.exists():
+            data = json.loads(count_file.read_text())
+            count = data.get("count", 0)
+        count += 1
+        count_file.write_text(json.dumps({"count": count}))
     return count
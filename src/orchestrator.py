@@ -1,17 +1,38 @@
 """Orchestrator — processes action files using Claude and manages the approval pipeline."""
 import logging
+import os
 import shutil
 import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
 
-from src.gmail_sender import send_reply, check_send_limit, increment_send_count
+from src.gmail_sender import SEND_LIMIT_LOCK, send_reply, check_send_limit, increment_send_count
 from src.utils import log_action, parse_frontmatter, extract_reply_block, extract_confidence
 from src.vault_sync import write_update
 
 logger = logging.getLogger("digital_fte.orchestrator")
 
 
+def _scan_md_files(root: Path) -> list[Path]:
+    """Collect all .md files under *root* (flat files and domain subdirs).
+
+    One os.scandir walk instead of Path.rglob — DirEntry type checks come
+    from the directory read itself, so no per-entry stat calls.
+    """
+    if not root.is_dir():
+        return []
+    found = []
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as it:
+            for entry in it:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith(".md"):
+                    found.append(Path(entry.path))
+    return found
+
+
 class Orchestrator:
     def __init__(self, vault_path: Path, claude_model: str = "claude-sonnet-4-5-20250929",
                  gmail_service=None, daily_send_limit: int = 20,
@@ -34,20 +55,18 @@ class Orchestrator:
 
     def get_pending_actions(self) -> list[Path]:
         priority_order = {"high": 0, "normal": 1, "low": 2}
-        # Scan recursively — picks up both flat files and domain subdirs
-        files = list(self.needs_action.rglob("*.md"))
 
         def _priority_key(path: Path) -> int:
             fm = parse_frontmatter(path)
             return priority_order.get(fm.get("priority", "normal"), 1)
 
-        return sorted(files, key=_priority_key)
+        return sorted(_scan_md_files(self.needs_action), key=_priority_key)
 
     def get_approved_actions(self) -> list[Path]:
-        return sorted(self.approved.rglob("*.md"))
+        return sorted(_scan_md_files(self.approved))
 
     def get_rejected_actions(self) -> list[Path]:
-        return sorted(self.rejected.rglob("*.md"))
+        return sorted(_scan_md_files(self.rejected))
 
     def _get_domain(self, action_file: Path) -> str:
         """Derive domain from the action file's parent directory.
@@ -190,11 +209,6 @@ class Orchestrator:
         metadata = parse_frontmatter(approved_file)
 
         if metadata.get("action") == "reply":
-            # Check daily send limit
-            if not check_send_limit(self.logs, self.daily_send_limit):
-                logger.warning(f"Daily send limit ({self.daily_send_limit}) reached. Skipping: {approved_file.name}")
-                return approved_file
-
             # Extract reply body
             reply_body = extract_reply_block(approved_file)
             if reply_body is None:
@@ -210,33 +224,40 @@ class Orchestrator:
                 )
                 return dest
 
-            # Send the reply
-            try:
-                send_reply(
-                    gmail_service=self.gmail_service,
-                    gmail_id=metadata["gmail_id"],
-                    to=metadata["to"],
-                    subject=metadata.get("subject", ""),
-                    body=reply_body,
-                )
-                increment_send_count(self.logs)
-                log_action(
-                    logs_dir=self.logs,
-                    actor="orchestrator",
-                    action="email_sent",
-                    source=approved_file.name,
-                    result=f"reply_to:{metadata['to']}",
-                )
-            except Exception as e:
-                logger.error(f"Failed to send reply for {approved_file.name}: {e}")
-                log_action(
-                    logs_dir=self.logs,
-                    actor="orchestrator",
-                    action="send_failed",
-                    source=approved_file.name,
-                    result=str(e),
-                )
-                return approved_file
+            # Check the daily limit and send under one lock — run_once runs
+            # send-capable stages on separate threads, and two of them must
+            # not both pass the check at limit-1.
+            with SEND_LIMIT_LOCK:
+                if not check_send_limit(self.logs, self.daily_send_limit):
+                    logger.warning(f"Daily send limit ({self.daily_send_limit}) reached. Skipping: {approved_file.name}")
+                    return approved_file
+
+                try:
+                    send_reply(
+                        gmail_service=self.gmail_service,
+                        gmail_id=metadata["gmail_id"],
+                        to=metadata["to"],
+                        subject=metadata.get("subject", ""),
+                        body=reply_body,
+                    )
+                    increment_send_count(self.logs)
+                    log_action(
+                        logs_dir=self.logs,
+                        actor="orchestrator",
+                        action="email_sent",
+                        source=approved_file.name,
+                        result=f"reply_to:{metadata['to']}",
+                    )
+                except Exception as e:
+                    logger.error(f"Failed to send reply for {approved_file.name}: {e}")
+                    log_action(
+                        logs_dir=self.logs,
+                        actor="orchestrator",
+                        action="send_failed",
+                        source=approved_file.name,
+                        result=str(e),
+                    )
+                    return approved_file
 
         dest = self.done / approved_file.name
         shutil.move(str(approved_file), str(dest))
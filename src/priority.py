@@ -1,5 +1,6 @@
 """Email priority classification based on rules."""
 import logging
+import sys
 
 logger = logging.getLogger("digital_fte.priority")
 
@@ -7,6 +8,13 @@ URGENCY_KEYWORDS = ["urgent", "asap", "deadline", "overdue"]
 
 NEWSLETTER_PATTERNS = ["noreply@", "no-reply@", "newsletter@", "notifications@", "mailer-daemon@"]
 
+# Interned result constants — callers comparing against "high"/"normal"/"low"
+# hit the identity fast path, and bulk classification allocates nothing on
+# the return path.
+_HIGH = sys.intern("high")
+_NORMAL = sys.intern("normal")
+_LOW = sys.intern("low")
+
 
 def classify_priority(
     subject: str = "",
@@ -27,18 +35,18 @@ def classify_priority(
     # Check urgency keywords
     for keyword in URGENCY_KEYWORDS:
         if keyword in subject_lower or keyword in body_lower:
-            return "high"
+            return _HIGH
 
     # Check VIP senders
     sender_lower = sender.lower()
     if vip_senders:
         for vip in vip_senders:
             if vip.lower() == sender_lower:
-                return "high"
+                return _HIGH
 
     # Check newsletter/notification patterns
     for pattern in NEWSLETTER_PATTERNS:
         if pattern in sender_lower:
-            return "low"
+            return _LOW
 
-    return "normal"
+    return _NORMAL
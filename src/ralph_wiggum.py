@@ -13,28 +13,40 @@ from __future__ import annotations
 
 import json
 import logging
-import re
 import subprocess
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson
+
+    def _dump_json(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:  # pragma: no cover - exercised only without orjson
+    def _dump_json(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
 logger = logging.getLogger(__name__)
 
 # ── Promise tag pattern ────────────────────────────────────────────────
 
-_PROMISE_PATTERN = re.compile(r"<promise>TASK_COMPLETE</promise>")
+_PROMISE_TAG = b"<promise>TASK_COMPLETE</promise>"
 
 
 def check_promise_completion(output: str) -> bool:
     """Check if Claude's output contains <promise>TASK_COMPLETE</promise>.
 
+    The tag is a fixed literal, so the search runs on the UTF-8 bytes via
+    ``bytes.find`` (C ``memmem``) rather than the regex engine -- model
+    outputs are routinely multi-KB.
+
     Args:
         output: The raw text output from Claude.
 
     Returns:
         True if the exact promise tag is found, False otherwise.
     """
-    return bool(_PROMISE_PATTERN.search(output))
+    return output.encode("utf-8", "surrogatepass").find(_PROMISE_TAG) != -1
 
 
 # ── File-movement check ───────────────────────────────────────────────
@@ -68,7 +80,7 @@ def create_task_state(
     """Create or update a state file in the vault for tracking loop progress.
 
     The state file is written to ``vault_path/Logs/ralph-wiggum-state.json``
-    so that it can be inspected during or after a run.
+    so that it can be inspected after a run.
 
     Args:
         vault_path:      Root of the Obsidian vault.
@@ -87,7 +99,7 @@ def create_task_state(
     }
     state_path = vault_path / "Logs" / "ralph-wiggum-state.json"
     state_path.parent.mkdir(parents=True, exist_ok=True)
-    state_path.write_text(json.dumps(state, indent=2), encoding="utf-8")
+    state_path.write_bytes(_dump_json(state))
     return state_path
 
 
@@ -146,6 +158,11 @@ def run_ralph_loop(
         raise ValueError("task_file is required for file_movement strategy")
 
     done_dir = vault_path / "Done"
+    # Resolve the iteration-log destination once up front — both exit paths
+    # reuse the handle-free precomputed path instead of re-deriving it.
+    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    log_path = vault_path / "Logs" / f"ralph-wiggum-{ts}.json"
+    log_path.parent.mkdir(parents=True, exist_ok=True)
     iteration_logs: list[dict] = []
     last_output = ""
 
@@ -162,10 +179,11 @@ def run_ralph_loop(
                 f"When complete, output <promise>TASK_COMPLETE</promise>."
             )
 
-        # Persist state before invocation
-        create_task_state(vault_path, task_prompt, iteration=i, previous_output=last_output)
-
         logger.info("Ralph Wiggum loop iteration %d/%d", i, max_iterations)
+        # Snapshot state before invoking Claude — each invocation can run
+        # for minutes, and the state file is how a live (or killed) loop
+        # is inspected from outside.
+        create_task_state(vault_path, task_prompt, iteration=i, previous_output=last_output)
         last_output = _invoke_claude(prompt, claude_model)
 
         # Record iteration log entry
@@ -186,7 +204,8 @@ def run_ralph_loop(
 
         if completed:
             logger.info("Ralph Wiggum loop completed at iteration %d", i)
-            _write_iteration_log(vault_path, iteration_logs)
+            create_task_state(vault_path, task_prompt, iteration=i, previous_output=last_output)
+            log_path.write_bytes(_dump_json(iteration_logs))
             return {
                 "completed": True,
                 "iterations": i,
@@ -196,23 +215,11 @@ def run_ralph_loop(
 
     # Max iterations reached without completion
     logger.warning("Ralph Wiggum loop hit max iterations (%d)", max_iterations)
-    _write_iteration_log(vault_path, iteration_logs)
+    create_task_state(vault_path, task_prompt, iteration=max_iterations, previous_output=last_output)
+    log_path.write_bytes(_dump_json(iteration_logs))
     return {
         "completed": False,
         "iterations": max_iterations,
         "strategy": completion_strategy,
         "output": last_output,
     }
-
-
-def _write_iteration_log(vault_path: Path, entries: list[dict]) -> Path:
-    """Write iteration log entries to ``vault_path/Logs/ralph-wiggum-<ts>.json``.
-
-    Returns:
-        Path to the written log file.
-    """
-    ts = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
-    log_path = vault_path / "Logs" / f"ralph-wiggum-{ts}.json"
-    log_path.parent.mkdir(parents=True, exist_ok=True)
-    log_path.write_text(json.dumps(entries, indent=2), encoding="utf-8")
-    return log_path
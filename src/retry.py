@@ -1,5 +1,7 @@
 """Retry logic with exponential backoff and graceful degradation."""
+import os
 import time
+import re
 import shutil
 import logging
 from datetime import datetime, timezone
@@ -8,6 +10,13 @@ from pathlib import Path
 
 logger = logging.getLogger("digital_fte.retry")
 
+# Targeted extraction of the one frontmatter field process_quarantine needs —
+# avoids parsing the whole frontmatter per quarantined file.
+_QTIME_RE = re.compile(r"^quarantine_time:\s*(\S+)", re.MULTILINE)
+
+# Strips both injected quarantine keys from a frontmatter block in one pass.
+_QMETA_RE = re.compile(r"^quarantine_(?:error|time):.*\n?", re.MULTILINE)
+
 
 class TransientError(Exception):
     """Errors that may resolve on retry (network, API rate limit, timeout)."""
@@ -28,9 +37,14 @@ def with_retry(max_attempts=3, base_delay=1, max_delay=60, on_failure=None):
         max_delay: Maximum delay cap in seconds
         on_failure: Optional callback(func_name, error, attempt) on each failure
     """
+    # Delay schedule is fixed per decoration — compute it once here rather
+    # than redoing the exponential arithmetic on every retry.
+    delays = [min(base_delay * (1 << i), max_delay) for i in range(max_attempts - 1)]
+
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
+            cb = on_failure
             last_error = None
             for attempt in range(1, max_attempts + 1):
                 try:
@@ -39,10 +53,10 @@ def with_retry(max_attempts=3, base_delay=1, max_delay=60, on_failure=None):
                     raise
                 except TransientError as e:
                     last_error = e
-                    if on_failure is not None:
-                        on_failure(func.__name__, e, attempt)
+                    if cb is not None:
+                        cb(func.__name__, e, attempt)
                     if attempt < max_attempts:
-                        delay = min(base_delay * (2 ** (attempt - 1)), max_delay)
+                        delay = delays[attempt - 1]
                         logger.warning(
                             "Attempt %d/%d for %s failed: %s. Retrying in %.1fs...",
                             attempt, max_attempts, func.__name__, e, delay,
@@ -81,16 +95,15 @@ def queue_failed_action(vault_path, action_file, error_msg):
 
     # Inject quarantine metadata into frontmatter
     if content.startswith("---"):
-        # Find the closing ---
+        # Splice the two lines in just before the closing --- — no need to
+        # take the existing frontmatter apart and rebuild it.
         end_idx = content.index("---", 3)
-        frontmatter = content[3:end_idx].strip()
-        body = content[end_idx + 3:]
-        new_frontmatter = (
-            f"{frontmatter}\n"
+        new_content = (
+            f"{content[:end_idx]}"
             f"quarantine_error: {error_msg}\n"
-            f"quarantine_time: {now}"
+            f"quarantine_time: {now}\n"
+            f"{content[end_idx:]}"
         )
-        new_content = f"---\n{new_frontmatter}\n---{body}"
     else:
         # No frontmatter — add one
         new_content = (
@@ -129,26 +142,36 @@ def process_quarantine(vault_path, min_age_seconds=300):
 
     moved = []
     now = datetime.now(timezone.utc)
+    now_ts = time.time()
 
-    for item in sorted(quarantine_dir.glob("*.md")):
+    with os.scandir(quarantine_dir) as it:
+        entries = sorted(
+            (e for e in it if e.name.endswith(".md") and e.is_file()),
+            key=lambda e: e.name,
+        )
+
+    for entry in entries:
+        item = Path(entry.path)
         content = item.read_text(encoding="utf-8")
 
-        # Parse quarantine_time from frontmatter
-        quarantine_time = _extract_quarantine_time(content)
-        if quarantine_time is None:
-            # No timestamp — treat as old enough to retry
-            pass
-        else:
-            age = (now - quarantine_time).total_seconds()
-            if age < min_age_seconds:
-                logger.debug("Skipping %s (age=%.0fs < %ds)", item.name, age, min_age_seconds)
-                continue
-
-        # Strip quarantine metadata and move back
+        # quarantine_time is written at (or before) the file itself, so an
+        # old mtime proves the item is past the transient window without
+        # parsing the frontmatter.  Fresh files still get the full check —
+        # mtime alone can't tell a recent quarantine from a re-touched one.
+        if now_ts - entry.stat().st_mtime < min_age_seconds:
+            quarantine_time = _extract_quarantine_time(content)
+            if quarantine_time is not None:
+                age = (now - quarantine_time).total_seconds()
+                if age < min_age_seconds:
+                    logger.debug("Skipping %s (age=%.0fs < %ds)", item.name, age, min_age_seconds)
+                    continue
+
+        # Strip quarantine metadata in place, then move back with a single
+        # atomic rename — no window where the item exists in both folders.
         clean_content = _strip_quarantine_metadata(content)
         dest = needs_action / item.name
-        dest.write_text(clean_content, encoding="utf-8")
-        item.unlink()
+        item.write_text(clean_content, encoding="utf-8")
+        os.replace(item, dest)
         moved.append(dest)
         logger.info("Restored %s from quarantine to Needs_Action/", item.name)
 
@@ -157,14 +180,13 @@ def process_quarantine(vault_path, min_age_seconds=300):
 
 def _extract_quarantine_time(content):
     """Extract quarantine_time from file frontmatter as a datetime."""
-    for line in content.splitlines():
-        if line.strip().startswith("quarantine_time:"):
-            time_str = line.split(":", 1)[1].strip()
-            try:
-                return datetime.fromisoformat(time_str)
-            except ValueError:
-                return None
-    return None
+    match = _QTIME_RE.search(content)
+    if match is None:
+        return None
+    try:
+        return datetime.fromisoformat(match.group(1))
+    except ValueError:
+        return None
 
 
 def _strip_quarantine_metadata(content):
@@ -173,14 +195,5 @@ def _strip_quarantine_metadata(content):
         return content
 
     end_idx = content.index("---", 3)
-    frontmatter_lines = content[3:end_idx].strip().splitlines()
-    body = content[end_idx + 3:]
-
-    cleaned_lines = [
-        line for line in frontmatter_lines
-        if not line.strip().startswith("quarantine_error:")
-        and not line.strip().startswith("quarantine_time:")
-    ]
-
-    cleaned_fm = "\n".join(cleaned_lines)
-    return f"---\n{cleaned_fm}\n---{body}"
+    cleaned_fm = _QMETA_RE.sub("", content[3:end_idx])
+    return f"---{cleaned_fm}{content[end_idx:]}"
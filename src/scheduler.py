@@ -14,10 +14,45 @@ Usage:
 import logging
 import time
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 logger = logging.getLogger("digital_fte.scheduler")
 
+# Scheduling templates — hoisted to module scope so each call only fills in
+# the two placeholders instead of rebuilding the whole string.
+_CRON_TEMPLATE = (
+    "*/5 * * * * cd {project_dir} && {python_path} -m src.scheduler --once"
+    " >> /tmp/digital-fte.log 2>&1"
+)
+
+_TASK_SCHEDULER_XML_TEMPLATE = """<?xml version="1.0" encoding="UTF-16"?>
+<Task version="1.2" xmlns="http://schemas.microsoft.com/windows/2004/02/mit/task">
+  <Triggers>
+    <TimeTrigger>
+      <Repetition>
+        <Interval>PT5M</Interval>
+        <StopAtDurationEnd>false</StopAtDurationEnd>
+      </Repetition>
+      <StartBoundary>2026-01-01T00:00:00</StartBoundary>
+      <Enabled>true</Enabled>
+    </TimeTrigger>
+  </Triggers>
+  <Actions>
+    <Exec>
+      <Command>{python_path}</Command>
+      <Arguments>-m src.scheduler --once</Arguments>
+      <WorkingDirectory>{project_dir}</WorkingDirectory>
+    </Exec>
+  </Actions>
+  <Settings>
+    <MultipleInstancesPolicy>IgnoreNew</MultipleInstancesPolicy>
+    <DisallowStartIfOnBatteries>false</DisallowStartIfOnBatteries>
+    <StopIfGoingOnBatteries>false</StopIfGoingOnBatteries>
+    <ExecutionTimeLimit>PT10M</ExecutionTimeLimit>
+  </Settings>
+</Task>"""
+
 
 def run_once(vault_path: Path, gmail_service=None, claude_model: str = "claude-sonnet-4-5-20250929",
              daily_send_limit: int = 20, auto_approve_threshold: float = 1.0,
@@ -67,17 +102,29 @@ def run_once(vault_path: Path, gmail_service=None, claude_model: str = "claude-s
         auto_approve_threshold=auto_approve_threshold,
     )
 
-    for action_file in orchestrator.get_pending_actions():
-        orchestrator.process_action(action_file)
-        results["actions_processed"] += 1
-
-    for approved_file in orchestrator.get_approved_actions():
-        orchestrator.execute_approved(approved_file)
-        results["approved_executed"] += 1
-
-    for rejected_file in orchestrator.get_rejected_actions():
-        orchestrator.review_rejected(rejected_file)
-        results["rejections_reviewed"] += 1
+    # Snapshot all three folders before any stage runs — auto-approval can
+    # move files into Approved/ mid-cycle, and those must not be picked up
+    # by a concurrently running execute stage.
+    pending = orchestrator.get_pending_actions()
+    approved = orchestrator.get_approved_actions()
+    rejected = orchestrator.get_rejected_actions()
+
+    def _run_stage(handler, files) -> int:
+        count = 0
+        for f in files:
+            handler(f)
+            count += 1
+        return count
+
+    # The stages are I/O-bound (Claude subprocesses, Gmail API, file moves)
+    # and operate on disjoint snapshots, so run them concurrently.
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        processed = pool.submit(_run_stage, orchestrator.process_action, pending)
+        executed = pool.submit(_run_stage, orchestrator.execute_approved, approved)
+        reviewed = pool.submit(_run_stage, orchestrator.review_rejected, rejected)
+        results["actions_processed"] = processed.result()
+        results["approved_executed"] = executed.result()
+        results["rejections_reviewed"] = reviewed.result()
 
     # Update dashboard
     update_dashboard(vault_path)
@@ -90,37 +137,16 @@ def generate_cron_entry(python_path: str = "python", project_dir: str = ".") ->
 
     Returns a cron line that runs every 5 minutes.
     """
-    return f"*/5 * * * * cd {project_dir} && {python_path} -m src.scheduler --once >> /tmp/digital-fte.log 2>&1"
+    return _CRON_TEMPLATE.format_map(
+        {"python_path": python_path, "project_dir": project_dir}
+    )
 
 
 def generate_task_scheduler_xml(python_path: str = "python", project_dir: str = ".") -> str:
     """Generate Windows Task Scheduler XML for scheduling the Digital FTE."""
-    return f"""<?xml version="1.0" encoding="UTF-16"?>
-<Task version="1.2" xmlns="http://schemas.microsoft.com/windows/2004/02/mit/task">
-  <Triggers>
-    <TimeTrigger>
-      <Repetition>
-        <Interval>PT5M</Interval>
-        <StopAtDurationEnd>false</StopAtDurationEnd>
-      </Repetition>
-      <StartBoundary>2026-01-01T00:00:00</StartBoundary>
-      <Enabled>true</Enabled>
-    </TimeTrigger>
-  </Triggers>
-  <Actions>
-    <Exec>
-      <Command>{python_path}</Command>
-      <Arguments>-m src.scheduler --once</Arguments>
-      <WorkingDirectory>{project_dir}</WorkingDirectory>
-    </Exec>
-  </Actions>
-  <Settings>
-    <MultipleInstancesPolicy>IgnoreNew</MultipleInstancesPolicy>
-    <DisallowStartIfOnBatteries>false</DisallowStartIfOnBatteries>
-    <StopIfGoingOnBatteries>false</StopIfGoingOnBatteries>
-    <ExecutionTimeLimit>PT10M</ExecutionTimeLimit>
-  </Settings>
-</Task>"""
+    return _TASK_SCHEDULER_XML_TEMPLATE.format_map(
+        {"python_path": python_path, "project_dir": project_dir}
+    )
 
 
 if __name__ == "__main__":
@@ -7,8 +7,10 @@ Validates at startup that credentials match the configured work zone.
 """
 import logging
 import os
+from collections.abc import Mapping
 from dataclasses import dataclass
 from pathlib import Path
+from types import MappingProxyType
 
 logger = logging.getLogger("digital_fte.secrets_isolation")
 
@@ -69,10 +71,11 @@ def validate_credentials(work_zone: str) -> CredentialReport:
     blocked = []
 
     if work_zone == "cloud":
-        # Cloud zone should not have execution credentials
-        for key in LOCAL_ONLY:
-            value = os.getenv(key, "")
-            if value.strip():
+        # Cloud zone should not have execution credentials.  One set
+        # intersection against the environment replaces a getenv per key;
+        # only the few present ones get the non-empty check.
+        for key in sorted(LOCAL_ONLY & os.environ.keys()):
+            if os.environ[key].strip():
                 warnings.append(
                     f"Cloud zone has execution credential '{key}' set — "
                     f"consider removing for security isolation"
@@ -100,28 +103,33 @@ def validate_credentials(work_zone: str) -> CredentialReport:
     )
 
 
-def get_zone_capabilities(work_zone: str) -> dict:
+# Capability tables are fixed per zone — built once, exposed read-only so
+# no caller can mutate the shared mapping.
+_ZONE_CAPABILITIES = {
+    "cloud": MappingProxyType({
+        "read_email": True,
+        "draft_plans": True,
+        "send_email": False,
+        "execute_actions": False,
+        "social_media_post": False,
+        "odoo_operations": False,
+        "approve_reject": False,
+    }),
+    "local": MappingProxyType({
+        "read_email": True,
+        "draft_plans": True,
+        "send_email": True,
+        "execute_actions": True,
+        "social_media_post": True,
+        "odoo_operations": True,
+        "approve_reject": True,
+    }),
+}
+
+
+def get_zone_capabilities(work_zone: str) -> Mapping[str, bool]:
     """Return what operations are allowed in the current zone.
 
-    Returns dict mapping capability names to booleans.
+    Returns a read-only mapping of capability names to booleans.
     """
-    if work_zone == "cloud":
-        return {
-            "read_email": True,
-            "draft_plans": True,
-            "send_email": False,
-            "execute_actions": False,
-            "social_media_post": False,
-            "odoo_operations": False,
-            "approve_reject": False,
-        }
-    else:  # local
-        return {
-            "read_email": True,
-            "draft_plans": True,
-            "send_email": True,
-            "execute_actions": True,
-            "social_media_post": True,
-            "odoo_operations": True,
-            "approve_reject": True,
-        }
+    return _ZONE_CAPABILITIES.get(work_zone, _ZONE_CAPABILITIES["local"])
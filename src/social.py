@@ -6,12 +6,24 @@ Each platform has its own poster class following a common interface.
 import json
 import logging
 import os
+import re
 from abc import ABC, abstractmethod
+from collections import Counter
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - exercised only without orjson
+    _loads = json.loads
+
 logger = logging.getLogger("digital_fte.social")
 
+# Daily logs are YYYY-MM-DD.jsonl; .json covers pre-NDJSON history.
+_DAILY_LOG_RE = re.compile(r"^\d{4}-\d{2}-\d{2}\.jsonl?$")
+
 
 class SocialPoster(ABC):
     """Base class for social media posters."""
@@ -123,9 +135,15 @@ class TwitterPoster(SocialPoster):
         return {"success": True, "platform": "twitter", "content": content}
 
 
-def get_all_posters() -> list[SocialPoster]:
-    """Return all configured social media posters."""
-    return [LinkedInPoster(), FacebookPoster(), InstagramPoster(), TwitterPoster()]
+@lru_cache(maxsize=1)
+def get_all_posters() -> tuple[SocialPoster, ...]:
+    """Return all configured social media posters.
+
+    Cached — construction re-reads credential env vars, which don't
+    change within a process. Call ``get_all_posters.cache_clear()``
+    after mutating the environment (e.g. in tests).
+    """
+    return (LinkedInPoster(), FacebookPoster(), InstagramPoster(), TwitterPoster())
 
 
 def create_social_post_draft(
@@ -183,23 +201,28 @@ def generate_social_summary(vault_path: Path, period_days: int = 7) -> str:
     if not logs_dir.is_dir():
         return "No social media activity recorded."
 
-    posts: dict[str, int] = {"linkedin": 0, "facebook": 0, "instagram": 0, "twitter": 0}
-    cutoff = datetime.now(timezone.utc).timestamp() - (period_days * 86400)
-
-    for log_file in sorted(logs_dir.glob("*.json")):
-        if log_file.name.startswith("."):
-            continue
+    # Stream each NDJSON log line-by-line — constant memory regardless of
+    # how many daily logs have accumulated. Legacy pre-NDJSON daily logs
+    # hold a single JSON array and are loaded whole.
+    counts: Counter[str] = Counter()
+    with os.scandir(logs_dir) as it:
+        log_files = sorted(e.path for e in it if _DAILY_LOG_RE.match(e.name))
+    for log_path in log_files:
         try:
-            entries = json.loads(log_file.read_text(encoding="utf-8"))
-            for entry in entries:
-                if entry.get("action") == "social_posted":
-                    result_str = entry.get("result", "")
-                    platform = result_str.split(":")[0] if ":" in result_str else ""
-                    if platform in posts:
-                        posts[platform] += 1
+            with open(log_path, "rb") as f:
+                if log_path.endswith(".jsonl"):
+                    entries = (_loads(line) for line in f if line.strip())
+                else:
+                    entries = _loads(f.read())
+                for entry in entries:
+                    if entry.get("action") == "social_posted":
+                        result_str = entry.get("result", "")
+                        counts[result_str.partition(":")[0]] += 1
         except (json.JSONDecodeError, OSError):
             continue
 
+    posts = {p: counts[p] for p in ("linkedin", "facebook", "instagram", "twitter")}
+
     lines = ["## Social Media Summary"]
     lines.append("| Platform | Posts |")
     lines.append("|----------|-------|")
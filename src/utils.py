@@ -1,11 +1,38 @@
 import json
 import logging
 import re
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 
 import yaml
 
+# libyaml-backed loader when available — several times faster than the
+# pure-Python SafeLoader on frontmatter-sized documents.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+try:
+    import orjson
+
+    _load_log_line = orjson.loads
+
+    def _dump_log_line(entry: dict) -> bytes:
+        return orjson.dumps(entry) + b"\n"
+except ImportError:  # pragma: no cover - exercised only without orjson
+    _load_log_line = json.loads
+
+    def _dump_log_line(entry: dict) -> bytes:
+        return (json.dumps(entry) + "\n").encode("utf-8")
+
+# Serializes appends to the daily log file — orchestrator stages log
+# concurrently when run_once runs them on a thread pool.
+_LOG_LOCK = threading.Lock()
+
+# Slug patterns compiled once — slugify runs on every inbound email subject.
+_SLUG_STRIP_RE = re.compile(r"[^\w\s-]")
+_SLUG_SEP_RE = re.compile(r"[\s_]+")
+_SLUG_DASH_RE = re.compile(r"-+")
+
 
 def setup_logging(level: str = "INFO") -> logging.Logger:
     """Configure and return the application logger."""
@@ -28,44 +55,65 @@ def log_action(
     source: str,
     result: str,
 ) -> None:
-    """Append a structured log entry to the daily JSON log file."""
+    """Append a structured log entry to the daily NDJSON log file.
+
+    One line per entry — appending never re-reads or re-serializes the
+    day's earlier events. Use :func:`read_log_entries` to load a file.
+    """
     logs_dir.mkdir(parents=True, exist_ok=True)
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    log_file = logs_dir / f"{today}.json"
-
-    entries = []
-    if log_file.exists():
-        entries = json.loads(log_file.read_text())
+    log_file = logs_dir / f"{today}.jsonl"
 
-    entries.append({
+    line = _dump_log_line({
         "timestamp": datetime.now(timezone.utc).isoformat(),
         "actor": actor,
         "action": action,
         "source": source,
         "result": result,
     })
-    log_file.write_text(json.dumps(entries, indent=2))
+    with _LOG_LOCK, open(log_file, "ab") as f:
+        f.write(line)
+
+
+def read_log_entries(log_file: Path) -> list[dict]:
+    """Load all entries from a daily log file.
+
+    Reads NDJSON (one object per line); legacy pre-NDJSON daily logs
+    that hold a single JSON array are still accepted, so history written
+    before the format switch keeps showing up.
+    """
+    with open(log_file, "rb") as f:
+        data = f.read()
+    if data.lstrip()[:1] == b"[":
+        return _load_log_line(data)
+    return [_load_log_line(line) for line in data.splitlines() if line.strip()]
 
 
 def slugify(text: str) -> str:
     """Convert text to a filesystem-safe slug."""
     text = text.lower().strip()
-    text = re.sub(r"[^\w\s-]", "", text)
-    text = re.sub(r"[\s_]+", "-", text)
-    text = re.sub(r"-+", "-", text)
+    text = _SLUG_STRIP_RE.sub("", text)
+    text = _SLUG_SEP_RE.sub("-", text)
+    text = _SLUG_DASH_RE.sub("-", text)
     return text.strip("-")
 
 
 def parse_frontmatter(file_path: Path) -> dict:
-    """Extract YAML frontmatter from a markdown file."""
-    text = file_path.read_text(encoding="utf-8")
-    if not text.startswith("---"):
-        return {}
+    """Extract YAML frontmatter from a markdown file.
+
+    Most vault files have no frontmatter, so the opening delimiter is
+    checked from the first few bytes before reading the whole file.
+    """
+    with open(file_path, "rb") as f:
+        head = f.read(4)
+        if head not in (b"---\n", b"---\r"):
+            return {}
+        text = (head + f.read()).decode("utf-8")
     parts = text.split("---", 2)
     if len(parts) < 3:
         return {}
     try:
-        return yaml.safe_load(parts[1]) or {}
+        return yaml.load(parts[1], Loader=_YAML_LOADER) or {}
     except yaml.YAMLError:
         return {}
 
@@ -73,13 +121,13 @@ def parse_frontmatter(file_path: Path) -> dict:
 def extract_reply_block(file_path: Path) -> str | None:
     """Extract reply text between ---BEGIN REPLY--- and ---END REPLY--- markers."""
     text = file_path.read_text(encoding="utf-8")
-    begin = "---BEGIN REPLY---"
-    end = "---END REPLY---"
-    start_idx = text.find(begin)
-    end_idx = text.find(end)
-    if start_idx == -1 or end_idx == -1:
+    _, sep, rest = text.partition("---BEGIN REPLY---")
+    if not sep:
+        return None
+    body, sep, _ = rest.partition("---END REPLY---")
+    if not sep:
         return None
-    return text[start_idx + len(begin):end_idx].strip()
+    return body.strip()
 
 
 def extract_confidence(response: str) -> float:
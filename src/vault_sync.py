@@ -11,6 +11,7 @@ Sync mechanism uses git as the transport layer:
 - sync_vault(): pull then push (full cycle)
 """
 import logging
+import os
 import subprocess
 from pathlib import Path
 
@@ -252,26 +253,28 @@ def merge_updates(vault_path: Path) -> int:
     if not updates_dir.is_dir():
         return 0
 
-    update_files = sorted(updates_dir.glob("*.md"))
-    if not update_files:
+    # Collect every update in one scandir pass, then append them to
+    # Dashboard.md in a single write instead of one rewrite per file.
+    paths: list[Path] = []
+    with os.scandir(updates_dir) as it:
+        for entry in sorted(it, key=lambda e: e.name):
+            if entry.is_file() and entry.name.endswith(".md"):
+                paths.append(Path(entry.path))
+    if not paths:
         return 0
 
-    dashboard_path = vault_path / "Dashboard.md"
-    dashboard_content = ""
-    if dashboard_path.exists():
-        dashboard_content = dashboard_path.read_text(encoding="utf-8")
-
-    merged = 0
-    for update_file in update_files:
+    sections = []
+    for update_file in paths:
         update_content = update_file.read_text(encoding="utf-8")
-        # Append update as a new section
-        dashboard_content += f"\n\n## Update: {update_file.stem}\n{update_content}"
-        update_file.unlink()
-        merged += 1
+        sections.append(f"\n\n## Update: {update_file.stem}\n{update_content}")
         logger.info(f"Merged update into Dashboard.md: {update_file.name}")
 
-    if merged > 0:
-        dashboard_path.write_text(dashboard_content, encoding="utf-8")
-        logger.info(f"Merged {merged} update(s) into Dashboard.md")
+    dashboard_path = vault_path / "Dashboard.md"
+    with open(dashboard_path, "a", encoding="utf-8") as f:
+        f.write("".join(sections))
+
+    for update_file in paths:
+        update_file.unlink()
 
-    return merged
+    logger.info(f"Merged {len(paths)} update(s) into Dashboard.md")
+    return len(paths)
@@ -1,5 +1,6 @@
 """File system watcher — monitors Incoming_Files for PDFs and images."""
 import logging
+import os
 import shutil
 from datetime import datetime, timezone
 from pathlib import Path
@@ -27,29 +28,38 @@ class FileWatcher(BaseWatcher):
     def check_for_updates(self) -> list[dict]:
         """Scan Incoming_Files for new PDFs and images."""
         items = []
-        if not self.incoming_dir.exists():
+        try:
+            # One scandir pass: dirent data answers is_file, and
+            # DirEntry.stat() reuses it instead of re-stat'ing per file.
+            with os.scandir(self.incoming_dir) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except FileNotFoundError:
             return items
 
-        for path in sorted(self.incoming_dir.iterdir()):
-            if not path.is_file():
+        for entry in entries:
+            if not entry.is_file(follow_symlinks=False):
                 continue
-            if path.suffix.lower() not in SUPPORTED_EXTENSIONS:
+            name = entry.name
+            dot = name.rfind(".")
+            ext = name[dot:].lower() if dot >= 0 else ""
+            if ext not in SUPPORTED_EXTENSIONS:
                 continue
-            if path.name in self._processed:
+            if name in self._processed:
                 continue
 
             now = datetime.now(timezone.utc).isoformat()
+            size = entry.stat().st_size
             item = {
-                "filename": path.name,
-                "extension": path.suffix.lower(),
-                "path": path,
+                "filename": name,
+                "extension": ext,
+                "path": Path(entry.path),
                 "detected_at": now,
-                "size_bytes": path.stat().st_size,
+                "size_bytes": size,
             }
             items.append(item)
 
             if self.dry_run:
-                logger.info(f"DRY-RUN: Detected {path.name} ({path.suffix.lower()}, {path.stat().st_size} bytes)")
+                logger.info(f"DRY-RUN: Detected {name} ({ext}, {size} bytes)")
 
         if items and not self.dry_run:
             logger.info(f"Detected {len(items)} new file(s) in Incoming_Files")
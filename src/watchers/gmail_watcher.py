@@ -1,5 +1,6 @@
 """Gmail watcher — polls Gmail API for unread emails and creates action files."""
 import base64
+import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
@@ -52,7 +53,7 @@ class GmailWatcher(BaseWatcher):
         content = f"""---
 type: email
 from: {item['from']}
-subject: {item['subject']}
+subject: {json.dumps(item['subject'])}
 date: {item['date']}
 priority: {priority}
 gmail_id: {item['id']}
@@ -1,54 +1,194 @@
 """FastAPI web dashboard for Digital FTE — makes the system visible and demonstrable."""
 import json
 import os
+import re
 import shutil
 from datetime import datetime, timezone
 from pathlib import Path
 
-from fastapi import FastAPI, Request
-from fastapi.responses import HTMLResponse, RedirectResponse
+import jinja2
+import orjson
+from fastapi import APIRouter, FastAPI, Request, Response
+from fastapi.responses import FileResponse, HTMLResponse, RedirectResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
 from src.dashboard import (
+    ACTIVE_FOLDERS,
+    MAX_RECENT_ENTRIES,
     OVERVIEW_FOLDERS,
-    _count_files,
-    _items_to_process,
+    _latest_log_file,
     _pending_approvals,
-    _recent_activity,
 )
-from src.utils import log_action, parse_frontmatter
+from src.utils import log_action, read_log_entries
 from src.secrets_isolation import get_zone_capabilities
 
-app = FastAPI(title="Digital FTE Dashboard", version="1.0.0")
+class _OrjsonResponse(Response):
+    """JSON response rendered by orjson — C-speed encode for the API routes.
+
+    fastapi.responses.ORJSONResponse is deprecated in fastapi 0.129, so
+    the equivalent two-line render lives here.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content)
+
+
+router = APIRouter()
 
 # Resolve paths relative to project root
 _project_root = Path(__file__).resolve().parent.parent
-app.mount("/static", StaticFiles(directory=str(_project_root / "static")), name="static")
-templates = Jinja2Templates(directory=str(_project_root / "templates"))
 
-# Will be set by create_app()
-_vault_path: Path | None = None
 
+async def _static_cache_control(request: Request, call_next):
+    """Let browsers cache static assets instead of re-requesting per page."""
+    response = await call_next(request)
+    if request.url.path.startswith("/static/"):
+        response.headers["Cache-Control"] = "public, max-age=3600"
+    return response
 
-def create_app(vault_path: Path) -> FastAPI:
-    """Configure the FastAPI app with vault path."""
-    global _vault_path
-    _vault_path = vault_path
-    return app
 
+# Templates never change at runtime: skip the per-render mtime check
+# (auto_reload) and keep every compiled template cached forever.
+templates = Jinja2Templates(
+    env=jinja2.Environment(
+        loader=jinja2.FileSystemLoader(str(_project_root / "templates")),
+        autoescape=True,
+        auto_reload=False,
+        cache_size=-1,
+    )
+)
+# Compile eagerly so no request pays the parse cost.
+templates.get_template("dashboard.html")
 
-def _get_vault() -> Path:
-    """Return the configured vault path."""
-    if _vault_path is None:
-        raise RuntimeError("Vault path not configured. Call create_app() first.")
-    return _vault_path
+def create_app(vault_path: Path) -> FastAPI:
+    """Build a dashboard app bound to *vault_path*.
+
+    A pure factory: each call returns a fresh FastAPI instance with the
+    vault stored on app.state, so multiple apps (or test workers) never
+    share mutable module state.
+    """
+    app = FastAPI(
+        title="Digital FTE Dashboard",
+        version="1.0.0",
+        default_response_class=_OrjsonResponse,
+    )
+    app.state.vault = vault_path
+    app.mount("/static", StaticFiles(directory=str(_project_root / "static")), name="static")
+    app.middleware("http")(_static_cache_control)
+    app.include_router(router)
+    return app
 
 
-@app.get("/", response_class=HTMLResponse)
+# Per-directory (mtime_ns, [(name, is_file)]) snapshots. Adding or removing
+# an entry bumps the directory's own mtime, so each directory is re-scanned
+# only when its contents actually changed; unchanged folders cost one stat.
+_FOLDER_CACHE: dict[str, tuple[int, list[tuple[str, bool]]]] = {}
+
+
+def _list_dir(folder: Path) -> list[tuple[str, bool]]:
+    """Return an mtime-cached (name, is_file) listing of one directory."""
+    try:
+        key = os.stat(folder).st_mtime_ns
+    except OSError:
+        return []
+    cached = _FOLDER_CACHE.get(str(folder))
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    with os.scandir(folder) as it:
+        entries = [(e.name, e.is_file(follow_symlinks=False)) for e in it]
+    _FOLDER_CACHE[str(folder)] = (key, entries)
+    return entries
+
+
+# Parsed log entries keyed by (mtime_ns, size) — a day's log is re-parsed
+# only after log_action appends to it.
+_LOG_CACHE: dict[str, tuple[int, int, list]] = {}
+
+
+def _read_log_cached(log_file: Path) -> list[dict]:
+    """Return parsed entries for *log_file*, cached against mtime and size."""
+    st = os.stat(log_file)
+    cached = _LOG_CACHE.get(str(log_file))
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        return cached[2]
+    entries = read_log_entries(log_file)
+    _LOG_CACHE[str(log_file)] = (st.st_mtime_ns, st.st_size, entries)
+    return entries
+
+
+def _recent_activity(vault_path: Path) -> list[dict]:
+    """Return the last MAX_RECENT_ENTRIES log entries from the latest log file."""
+    log_file = _latest_log_file(vault_path / "Logs")
+    if log_file is None:
+        return []
+    try:
+        entries = _read_log_cached(log_file)
+    except (json.JSONDecodeError, ValueError, OSError):
+        return []
+    return entries[-MAX_RECENT_ENTRIES:]
+
+
+_FM_LINE_RE = re.compile(r"^([A-Za-z_][\w-]*):[ \t]*(.*?)[ \t\r]*$", re.MULTILINE)
+
+
+def _fast_frontmatter(path: Path) -> dict:
+    """Flat ``key: value`` frontmatter extractor for the dashboard listings.
+
+    The vault's watchers emit only scalar frontmatter lines, so a
+    compiled regex over the delimited block replaces a full YAML parse
+    on this hot path. Values the watchers JSON-quote (e.g. email
+    subjects) are decoded with orjson; everything else stays a string.
+    """
+    try:
+        with open(path, "rb") as f:
+            head = f.read(4)
+            if head not in (b"---\n", b"---\r"):
+                return {}
+            text = (head + f.read()).decode("utf-8")
+    except OSError:
+        return {}
+    if head == b"---\r":
+        # CRLF file — normalize so the \n-based delimiter partitions below
+        # find the block (utils.parse_frontmatter accepts these files too).
+        text = text.replace("\r\n", "\n")
+    _, _, rest = text.partition("---\n")
+    block, sep, _ = rest.partition("\n---")
+    if not sep:
+        return {}
+    meta = {}
+    for key, value in _FM_LINE_RE.findall(block):
+        if value.startswith('"') and value.endswith('"'):
+            try:
+                value = orjson.loads(value)
+            except ValueError:
+                pass
+        meta[key] = value
+    return meta
+
+
+def _count_files(folder: Path) -> int:
+    """Count files in *folder* and subdirs using cached listings."""
+    total = 0
+    for name, is_file in _list_dir(folder):
+        if is_file:
+            total += 1
+        else:
+            total += _count_files(folder / name)
+    return total
+
+
+def _items_to_process(vault_path: Path) -> int:
+    """Count total files across folders that indicate work to do."""
+    return sum(_count_files(vault_path / f) for f in ACTIVE_FOLDERS)
+
+
+@router.get("/", response_class=HTMLResponse)
 async def dashboard_page(request: Request):
     """Main dashboard page — shows system status, vault overview, approvals, activity."""
-    vault = _get_vault()
+    vault = request.app.state.vault
     total_active = _items_to_process(vault)
     status = "Active" if total_active > 0 else "Idle"
     status_color = "#22c55e" if total_active > 0 else "#6b7280"
@@ -65,7 +205,7 @@ async def dashboard_page(request: Request):
     if pa_dir.is_dir():
         for f in sorted(pa_dir.rglob("*.md")):
             if f.is_file():
-                fm = parse_frontmatter(f)
+                fm = _fast_frontmatter(f)
                 # Build relative path for approve/reject routes
                 rel = f.relative_to(pa_dir)
                 approvals.append({
@@ -89,7 +229,7 @@ async def dashboard_page(request: Request):
     if na_dir.is_dir():
         for f in sorted(na_dir.rglob("*.md")):
             if f.is_file():
-                fm = parse_frontmatter(f)
+                fm = _fast_frontmatter(f)
                 needs_action.append({
                     "name": f.name,
                     "domain": f.parent.name if f.parent != na_dir else "",
@@ -128,10 +268,10 @@ async def dashboard_page(request: Request):
     })
 
 
-@app.get("/health")
-async def health_check():
+@router.get("/health")
+async def health_check(request: Request):
     """Health endpoint for cloud monitoring and load balancers."""
-    vault = _get_vault()
+    vault = request.app.state.vault
     work_zone = os.getenv("WORK_ZONE", "local")
     return {
         "status": "healthy",
@@ -142,10 +282,10 @@ async def health_check():
     }
 
 
-@app.get("/api/status")
-async def api_status():
+@router.get("/api/status")
+async def api_status(request: Request):
     """JSON API — vault status overview."""
-    vault = _get_vault()
+    vault = request.app.state.vault
     counts = {f: _count_files(vault / f) for f in OVERVIEW_FOLDERS}
     total_active = _items_to_process(vault)
     work_zone = os.getenv("WORK_ZONE", "local")
@@ -157,33 +297,78 @@ async def api_status():
     }
 
 
-@app.get("/api/pending")
-async def api_pending():
+# Pre-encoded bodies for the common "nothing to do" poll responses.
+_EMPTY_PENDING = json.dumps({"approvals": []}).encode("utf-8")
+_EMPTY_ACTIVITY = json.dumps({"activity": []}).encode("utf-8")
+
+
+def _dir_is_empty(folder: Path) -> bool:
+    """True if *folder* is missing or has no entries — a single scandir probe."""
+    try:
+        with os.scandir(folder) as it:
+            return next(it, None) is None
+    except FileNotFoundError:
+        return True
+
+
+def _no_pending_items(folder: Path) -> bool:
+    """True if *folder* holds no .md files, directly or one subdir level down.
+
+    setup_vault pre-creates email/file/social domain subdirs inside
+    Pending_Approval, so a bare emptiness probe never fires on an
+    initialized vault — the probe has to look through those subdirs.
+    """
+    subdirs = []
+    try:
+        with os.scandir(folder) as it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    subdirs.append(e.path)
+                elif e.name.endswith(".md"):
+                    return False
+    except FileNotFoundError:
+        return True
+    for sub in subdirs:
+        try:
+            with os.scandir(sub) as it:
+                if any(e.name.endswith(".md") and e.is_file(follow_symlinks=False) for e in it):
+                    return False
+        except FileNotFoundError:
+            continue
+    return True
+
+
+@router.get("/api/pending")
+async def api_pending(request: Request):
     """JSON API — list pending approval items."""
-    vault = _get_vault()
+    vault = request.app.state.vault
+    if _no_pending_items(vault / "Pending_Approval"):
+        return Response(content=_EMPTY_PENDING, media_type="application/json")
     return {"approvals": _pending_approvals(vault)}
 
 
-@app.get("/api/activity")
-async def api_activity():
+@router.get("/api/activity")
+async def api_activity(request: Request):
     """JSON API — recent activity log."""
-    vault = _get_vault()
+    vault = request.app.state.vault
+    if _dir_is_empty(vault / "Logs"):
+        return Response(content=_EMPTY_ACTIVITY, media_type="application/json")
     entries = _recent_activity(vault)
     entries.reverse()
     return {"activity": entries}
 
 
-@app.get("/tasks")
-async def tasks_list():
+@router.get("/tasks")
+async def tasks_list(request: Request):
     """JSON API — list current tasks from Needs_Action and Pending_Approval."""
-    vault = _get_vault()
+    vault = request.app.state.vault
     tasks = []
     for folder in ["Needs_Action", "Pending_Approval"]:
         folder_dir = vault / folder
         if folder_dir.is_dir():
             for f in sorted(folder_dir.rglob("*.md")):
                 if f.is_file():
-                    fm = parse_frontmatter(f)
+                    fm = _fast_frontmatter(f)
                     tasks.append({
                         "name": f.name,
                         "folder": folder,
@@ -194,10 +379,10 @@ async def tasks_list():
     return {"tasks": tasks}
 
 
-@app.post("/approve/{filepath:path}")
-async def approve_action(filepath: str):
+@router.post("/approve/{filepath:path}")
+async def approve_action(request: Request, filepath: str):
     """Move a file from Pending_Approval to Approved (supports domain subdirs)."""
-    vault = _get_vault()
+    vault = request.app.state.vault
     src = vault / "Pending_Approval" / filepath
     if not src.exists():
         return {"error": f"File not found: {filepath}"}
@@ -214,10 +399,10 @@ async def approve_action(filepath: str):
     return RedirectResponse(url="/", status_code=303)
 
 
-@app.post("/reject/{filepath:path}")
-async def reject_action(filepath: str):
+@router.post("/reject/{filepath:path}")
+async def reject_action(request: Request, filepath: str):
     """Move a file from Pending_Approval to Rejected (supports domain subdirs)."""
-    vault = _get_vault()
+    vault = request.app.state.vault
     src = vault / "Pending_Approval" / filepath
     if not src.exists():
         return {"error": f"File not found: {filepath}"}
@@ -234,16 +419,12 @@ async def reject_action(filepath: str):
     return RedirectResponse(url="/", status_code=303)
 
 
-@app.get("/view/{folder}/{filename}", response_class=HTMLResponse)
+@router.get("/view/{folder}/{filename}")
 async def view_file(request: Request, folder: str, filename: str):
-    """View a file's content."""
-    vault = _get_vault()
-    file_path = vault / folder / filename
-    if not file_path.exists():
+    """Serve a vault file's content straight from disk."""
+    vault = request.app.state.vault
+    file_path = (vault / folder / filename).resolve()
+    if not file_path.is_relative_to(vault.resolve()) or not file_path.is_file():
         return HTMLResponse(content="<h1>File not found</h1>", status_code=404)
-    content = file_path.read_text(encoding="utf-8")
-    return templates.TemplateResponse(request, "view.html", {
-        "filename": filename,
-        "folder": folder,
-        "content": content,
-    })
+    # FileResponse streams via sendfile — the file never transits Python.
+    return FileResponse(file_path, media_type="text/markdown")
@@ -0,0 +1,15 @@
+"""Lightweight stand-in for subprocess.run results in tests.
+
+A namedtuple is much cheaper to construct than a MagicMock and exposes
+exactly the attributes the code under test reads (returncode, stdout,
+stderr) — any other attribute access fails loudly instead of silently
+returning a child mock.
+"""
+from collections import namedtuple
+
+FakeProc = namedtuple("FakeProc", "returncode stdout stderr")
+
+
+def fake_proc(stdout: str, returncode: int = 0, stderr: str = "") -> FakeProc:
+    """Build a completed-process stub for patching subprocess.run."""
+    return FakeProc(returncode=returncode, stdout=stdout, stderr=stderr)
@@ -0,0 +1,60 @@
+"""Shared fixtures — session-scoped vault templates.
+
+Building the vault folder set (and for git tests, a whole repository)
+from scratch in every test adds up across the suite. The templates here
+are built once per session; function-scoped fixtures clone them into
+each test's tmp_path with shutil.copytree.
+"""
+import os
+import shutil
+import tempfile
+
+import pytest
+from dulwich import porcelain
+
+
+def pytest_configure(config):
+    # Keep tmp_path on tmpfs where available — the suite is dominated by
+    # small-file writes that never need to survive the run, so there is
+    # no reason to pay block-device latency for them. An explicit
+    # --basetemp still wins.
+    if config.option.basetemp is None and os.access("/dev/shm", os.W_OK):
+        tempfile.tempdir = "/dev/shm"
+
+VAULT_TEMPLATE_FOLDERS = (
+    "Inbox", "Needs_Action", "Plans", "Pending_Approval",
+    "Approved", "Done", "Logs", "Incoming_Files", "Rejected",
+)
+
+
+@pytest.fixture(scope="session")
+def vault_template(tmp_path_factory):
+    """Canonical vault folder structure, built once per session."""
+    template = tmp_path_factory.mktemp("vault_template", numbered=False)
+    for folder in VAULT_TEMPLATE_FOLDERS:
+        (template / folder).mkdir()
+    return template
+
+
+@pytest.fixture(scope="session")
+def git_vault_template(tmp_path_factory, vault_template):
+    """Vault template that is also an initialized git repo with one commit."""
+    template = tmp_path_factory.mktemp("git_vault_template", numbered=False)
+    shutil.copytree(vault_template, template, dirs_exist_ok=True)
+    # dulwich keeps repo setup in-process — no git subprocess forks. The
+    # on-disk repo is a normal one, so production code (and tests) can
+    # still run the real git CLI against copies of it.
+    repo = porcelain.init(str(template))
+    config = repo.get_config()
+    config.set((b"user",), b"name", b"Test")
+    config.set((b"user",), b"email", b"test@test.com")
+    config.write_to_path()
+    (template / ".gitkeep").write_text("")
+    porcelain.add(repo, [str(template / ".gitkeep")])
+    porcelain.commit(
+        repo,
+        message=b"init",
+        author=b"Test <test@test.com>",
+        committer=b"Test <test@test.com>",
+    )
+    return template
@@ -57,8 +57,8 @@ def test_get_period_stats_counts_actions(vault):
         {"timestamp": f"{today}T10:06:00+00:00", "actor": "orchestrator",
          "action": "send_failed", "source": "plan-g.md", "result": "error"},
     ]
-    log_file = vault / "Logs" / f"{today}.json"
-    log_file.write_text(json.dumps(entries, indent=2))
+    log_file = vault / "Logs" / f"{today}.jsonl"
+    log_file.write_text("\n".join(json.dumps(e) for e in entries) + "\n")
 
     stats = get_period_stats(vault, period_days=7)
     assert stats["emails_sent"] == 2
@@ -82,7 +82,7 @@ def test_get_period_stats_filters_by_period(vault):
         {"timestamp": f"{today}T10:00:00+00:00", "actor": "orchestrator",
          "action": "email_sent", "source": "plan-a.md", "result": "reply_to:x@x.com"},
     ]
-    (vault / "Logs" / f"{today}.json").write_text(json.dumps(today_entries, indent=2))
+    (vault / "Logs" / f"{today}.jsonl").write_text("\n".join(json.dumps(e) for e in today_entries) + "\n")
 
     # Old log — should NOT be counted with period_days=7
     old_entries = [
@@ -91,7 +91,7 @@ def test_get_period_stats_filters_by_period(vault):
         {"timestamp": f"{old_date}T10:01:00+00:00", "actor": "orchestrator",
          "action": "plan_created", "source": "email-old.md", "result": "pending"},
     ]
-    (vault / "Logs" / f"{old_date}.json").write_text(json.dumps(old_entries, indent=2))
+    (vault / "Logs" / f"{old_date}.jsonl").write_text("\n".join(json.dumps(e) for e in old_entries) + "\n")
 
     stats = get_period_stats(vault, period_days=7)
     assert stats["emails_sent"] == 1
@@ -223,7 +223,7 @@ def test_generate_briefing_shows_activity_table(vault):
         {"timestamp": f"{today}T10:01:00+00:00", "actor": "orchestrator",
          "action": "plan_created", "source": "email-b.md", "result": "pending"},
     ]
-    (vault / "Logs" / f"{today}.json").write_text(json.dumps(entries, indent=2))
+    (vault / "Logs" / f"{today}.jsonl").write_text("\n".join(json.dumps(e) for e in entries) + "\n")
 
     md = generate_briefing(vault)
     assert "| Metric | Count |" in md
@@ -100,7 +100,7 @@ def test_pending_approvals_empty(vault):
 
 
 def test_recent_activity_reads_from_logs(vault):
-    """Recent Activity should display entries from the latest Logs/*.json file."""
+    """Recent Activity should display entries from the latest Logs/*.jsonl file."""
     from src.dashboard import generate_dashboard
 
     entries = [
@@ -119,8 +119,8 @@ def test_recent_activity_reads_from_logs(vault):
             "result": "pending_approval:plan-urgent.md",
         },
     ]
-    log_file = vault / "Logs" / "2026-02-17.json"
-    log_file.write_text(json.dumps(entries, indent=2))
+    log_file = vault / "Logs" / "2026-02-17.jsonl"
+    log_file.write_text("\n".join(json.dumps(e) for e in entries) + "\n")
 
     md = generate_dashboard(vault)
     assert "## Recent Activity" in md
@@ -150,8 +150,8 @@ def test_recent_activity_limits_to_10_entries(vault):
             "source": f"file-{i}.md",
             "result": f"result_{i}",
         })
-    log_file = vault / "Logs" / "2026-02-17.json"
-    log_file.write_text(json.dumps(entries, indent=2))
+    log_file = vault / "Logs" / "2026-02-17.jsonl"
+    log_file.write_text("\n".join(json.dumps(e) for e in entries) + "\n")
 
     md = generate_dashboard(vault)
     # Should contain entries 5-14 (last 10), not entries 0-4
@@ -74,9 +74,9 @@ def test_platinum_demo_flow(vault):
     assert not approved_file.exists()
 
     # Verify log entry
-    log_files = list((vault / "Logs").glob("*.json"))
+    log_files = list((vault / "Logs").glob("*.jsonl"))
     assert len(log_files) >= 1
-    entries = json.loads(log_files[0].read_text(encoding="utf-8"))
+    entries = [json.loads(line) for line in log_files[0].read_text(encoding="utf-8").splitlines() if line]
     assert any(e["action"] == "email_sent" for e in entries)
 
     # Verify final vault state
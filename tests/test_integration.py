@@ -198,8 +198,8 @@ def test_auto_approve_pipeline(tmp_path):
     import json
     from datetime import datetime, timezone
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    log_file = tmp_path / "Logs" / f"{today}.json"
-    entries = json.loads(log_file.read_text())
+    log_file = tmp_path / "Logs" / f"{today}.jsonl"
+    entries = [json.loads(line) for line in log_file.read_text().splitlines() if line]
     auto_entries = [e for e in entries if e["action"] == "auto_approved"]
     assert len(auto_entries) >= 1
 
@@ -114,10 +114,10 @@ def test_send_email_logs_action(mock_gmail, set_vault_path):
     )
 
     # Filter out .send_count_* files — only look at date-based log files
-    log_files = [f for f in (set_vault_path / "Logs").glob("*.json")
+    log_files = [f for f in (set_vault_path / "Logs").glob("*.jsonl")
                  if not f.name.startswith(".send_count")]
     assert len(log_files) >= 1
-    entries = json.loads(log_files[0].read_text())
+    entries = [json.loads(line) for line in log_files[0].read_text().splitlines() if line]
     assert any(e["action"] == "email_sent" for e in entries)
 
 
@@ -388,9 +388,9 @@ def test_auto_approve_logs_action(vault):
         orch.process_action(action_file)
     # Check logs for auto_approved entry
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    log_file = vault / "Logs" / f"{today}.json"
+    log_file = vault / "Logs" / f"{today}.jsonl"
     assert log_file.exists()
-    entries = json.loads(log_file.read_text())
+    entries = [json.loads(line) for line in log_file.read_text().splitlines() if line]
     auto_entries = [e for e in entries if e["action"] == "auto_approved"]
     assert len(auto_entries) >= 1
     assert "confidence:0.9" in auto_entries[0]["result"]
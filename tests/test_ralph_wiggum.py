@@ -1,18 +1,26 @@
 """Tests for the Ralph Wiggum autonomous loop."""
 import json
+import os
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 
 import pytest
 
+from tests._subprocess_stub import fake_proc
+
+_VAULT_FOLDERS = (
+    "Inbox", "Needs_Action", "Plans", "Pending_Approval",
+    "Approved", "Done", "Logs", "Incoming_Files", "Rejected",
+    "Briefings",
+)
+
 
 @pytest.fixture
 def vault(tmp_path):
     """Create a minimal vault structure for testing."""
-    for folder in ["Inbox", "Needs_Action", "Plans", "Pending_Approval",
-                    "Approved", "Done", "Logs", "Incoming_Files", "Rejected",
-                    "Briefings"]:
-        (tmp_path / folder).mkdir()
+    base = os.fspath(tmp_path)
+    for folder in _VAULT_FOLDERS:
+        os.mkdir(os.path.join(base, folder))
     return tmp_path
 
 
@@ -92,9 +100,7 @@ def test_create_task_state_includes_iteration(vault):
 def test_run_ralph_loop_completes_on_promise(vault):
     """Loop should complete when Claude returns TASK_COMPLETE promise."""
     from src.ralph_wiggum import run_ralph_loop
-    mock_result = MagicMock()
-    mock_result.returncode = 0
-    mock_result.stdout = "All done!\n<promise>TASK_COMPLETE</promise>"
+    mock_result = fake_proc("All done!\n<promise>TASK_COMPLETE</promise>")
     with patch("subprocess.run", return_value=mock_result):
         result = run_ralph_loop(
             vault_path=vault,
@@ -111,9 +117,7 @@ def test_run_ralph_loop_completes_on_promise(vault):
 def test_run_ralph_loop_stops_at_max_iterations(vault):
     """Loop should stop after max_iterations and report incomplete."""
     from src.ralph_wiggum import run_ralph_loop
-    mock_result = MagicMock()
-    mock_result.returncode = 0
-    mock_result.stdout = "Still working on it..."
+    mock_result = fake_proc("Still working on it...")
     with patch("subprocess.run", return_value=mock_result):
         result = run_ralph_loop(
             vault_path=vault,
@@ -141,10 +145,7 @@ def test_run_ralph_loop_file_movement_strategy(vault):
             (vault / "Done" / "task-move.md").write_text("# Task completed")
             if task_file.exists():
                 task_file.unlink()
-        mock = MagicMock()
-        mock.returncode = 0
-        mock.stdout = f"Iteration {call_count} output"
-        return mock
+        return fake_proc(f"Iteration {call_count} output")
 
     with patch("subprocess.run", side_effect=fake_subprocess_run):
         result = run_ralph_loop(
@@ -162,9 +163,7 @@ def test_run_ralph_loop_file_movement_strategy(vault):
 def test_run_ralph_loop_returns_result_dict(vault):
     """Result dict must contain completed, iterations, strategy, output keys."""
     from src.ralph_wiggum import run_ralph_loop
-    mock_result = MagicMock()
-    mock_result.returncode = 0
-    mock_result.stdout = "Done\n<promise>TASK_COMPLETE</promise>"
+    mock_result = fake_proc("Done\n<promise>TASK_COMPLETE</promise>")
     with patch("subprocess.run", return_value=mock_result):
         result = run_ralph_loop(
             vault_path=vault,
@@ -186,13 +185,9 @@ def test_run_ralph_loop_logs_iterations(vault):
     def fake_run(*args, **kwargs):
         nonlocal call_count
         call_count += 1
-        mock = MagicMock()
-        mock.returncode = 0
         if call_count >= 2:
-            mock.stdout = "Finished!\n<promise>TASK_COMPLETE</promise>"
-        else:
-            mock.stdout = "Working..."
-        return mock
+            return fake_proc("Finished!\n<promise>TASK_COMPLETE</promise>")
+        return fake_proc("Working...")
 
     with patch("subprocess.run", side_effect=fake_run):
         run_ralph_loop(
@@ -1,4 +1,5 @@
 """Tests for the scheduler module."""
+import os
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -6,15 +7,18 @@ import pytest
 
 from src.scheduler import run_once, generate_cron_entry, generate_task_scheduler_xml
 
+_VAULT_FOLDERS = (
+    "Inbox", "Needs_Action", "Plans", "Pending_Approval",
+    "Approved", "Done", "Logs", "Incoming_Files", "Rejected",
+)
+
 
 @pytest.fixture()
 def vault(tmp_path):
     """Create a minimal vault structure."""
-    for folder in [
-        "Inbox", "Needs_Action", "Plans", "Pending_Approval",
-        "Approved", "Done", "Logs", "Incoming_Files", "Rejected",
-    ]:
-        (tmp_path / folder).mkdir()
+    base = os.fspath(tmp_path)
+    for folder in _VAULT_FOLDERS:
+        os.mkdir(os.path.join(base, folder))
     return tmp_path
 
 
@@ -2,12 +2,17 @@
 import os
 import pytest
 
+from src.secrets_isolation import (
+    CredentialReport,
+    get_zone_capabilities,
+    validate_credentials,
+)
+
 
 def test_cloud_zone_warns_on_execution_credentials(monkeypatch):
     """Cloud zone should warn when execution credentials are present."""
     monkeypatch.setenv("LINKEDIN_ACCESS_TOKEN", "tok_12345")
     monkeypatch.setenv("TWITTER_API_KEY", "key_xyz")
-    from src.secrets_isolation import validate_credentials
     report = validate_credentials("cloud")
     assert report.valid is True
     assert len(report.warnings) >= 2
@@ -22,7 +27,6 @@ def test_cloud_zone_no_warnings_when_clean(monkeypatch):
                 "ODOO_URL", "ODOO_DB", "ODOO_USERNAME", "ODOO_PASSWORD",
                 "DAILY_SEND_LIMIT"]:
         monkeypatch.delenv(key, raising=False)
-    from src.secrets_isolation import validate_credentials
     report = validate_credentials("cloud")
     assert report.valid is True
     assert len(report.warnings) == 0
@@ -31,7 +35,6 @@ def test_cloud_zone_no_warnings_when_clean(monkeypatch):
 def test_local_zone_always_valid(monkeypatch):
     """Local zone should always be valid regardless of credentials."""
     monkeypatch.setenv("LINKEDIN_ACCESS_TOKEN", "tok_12345")
-    from src.secrets_isolation import validate_credentials
     report = validate_credentials("local")
     assert report.valid is True
 
@@ -39,7 +42,6 @@ def test_local_zone_always_valid(monkeypatch):
 def test_local_zone_warns_missing_gmail_creds(monkeypatch, tmp_path):
     """Local zone should warn if Gmail credentials file is missing."""
     monkeypatch.chdir(tmp_path)
-    from src.secrets_isolation import validate_credentials
     report = validate_credentials("local")
     assert report.valid is True
     assert any("client_secret.json" in w for w in report.warnings)
@@ -47,7 +49,6 @@ def test_local_zone_warns_missing_gmail_creds(monkeypatch, tmp_path):
 
 def test_unknown_zone_blocked():
     """Unknown work zone should be blocked."""
-    from src.secrets_isolation import validate_credentials
     report = validate_credentials("unknown")
     assert report.valid is False
     assert len(report.blocked) >= 1
@@ -56,7 +57,6 @@ def test_unknown_zone_blocked():
 
 def test_credential_report_fields():
     """CredentialReport should have all expected fields."""
-    from src.secrets_isolation import CredentialReport
     report = CredentialReport(zone="local", valid=True, warnings=[], blocked=[])
     assert report.zone == "local"
     assert report.valid is True
@@ -66,7 +66,6 @@ def test_credential_report_fields():
 
 def test_cloud_zone_capabilities():
     """Cloud zone should block execution capabilities."""
-    from src.secrets_isolation import get_zone_capabilities
     caps = get_zone_capabilities("cloud")
     assert caps["read_email"] is True
     assert caps["draft_plans"] is True
@@ -79,13 +78,11 @@ def test_cloud_zone_capabilities():
 
 def test_local_zone_capabilities():
     """Local zone should allow all capabilities."""
-    from src.secrets_isolation import get_zone_capabilities
     caps = get_zone_capabilities("local")
     assert all(v is True for v in caps.values())
 
 
 def test_cloud_zone_has_correct_report_zone():
     """Credential report zone field should match input."""
-    from src.secrets_isolation import validate_credentials
     report = validate_credentials("cloud")
     assert report.zone == "cloud"
@@ -1,7 +1,5 @@
 """Tests for the social media posting module (src/social.py)."""
 import json
-from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
@@ -192,8 +190,8 @@ def test_generate_social_summary_with_posts(tmp_path):
             "result": "twitter:Another post",
         },
     ]
-    log_file = logs_dir / "2026-02-17.json"
-    log_file.write_text(json.dumps(entries), encoding="utf-8")
+    log_file = logs_dir / "2026-02-17.jsonl"
+    log_file.write_text("\n".join(json.dumps(e) for e in entries) + "\n", encoding="utf-8")
 
     summary = generate_social_summary(tmp_path)
     assert "## Social Media Summary" in summary
@@ -1,23 +1,21 @@
 """Tests for the Social Media MCP Server tools."""
 import json
+import shutil
 from pathlib import Path
 
 import pytest
 
-# We test the tool functions directly (not via MCP protocol)
-import mcp_servers.social_server as social_server
+# We test the tool functions directly (not via MCP protocol) — importing
+# _social_tools skips the FastMCP stack entirely.
+import mcp_servers._social_tools as social_server
 
 
 @pytest.fixture(autouse=True)
-def set_vault_path(tmp_path):
-    """Override vault path for all tests."""
-    for folder in [
-        "Inbox", "Needs_Action", "Plans", "Pending_Approval",
-        "Approved", "Done", "Logs", "Incoming_Files", "Rejected",
-    ]:
-        (tmp_path / folder).mkdir()
-    social_server.VAULT_PATH = tmp_path
-    yield tmp_path
+def set_vault_path(tmp_path, vault_template, monkeypatch):
+    """Override vault path for all tests, restored on teardown."""
+    shutil.copytree(vault_template, tmp_path, dirs_exist_ok=True)
+    monkeypatch.setattr(social_server, "VAULT_PATH", tmp_path)
+    return tmp_path
 
 
 # --- create_draft_post tests ---
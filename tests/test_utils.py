@@ -1,11 +1,23 @@
-import json
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    import json as orjson
+
+from src.utils import (
+    extract_confidence,
+    extract_reply_block,
+    log_action,
+    parse_frontmatter,
+    read_log_entries,
+    slugify,
+)
+
 
 def test_log_action_creates_daily_log_file(tmp_path):
-    """log_action should create a JSON log file named YYYY-MM-DD.json."""
-    from src.utils import log_action
+    """log_action should create an NDJSON log file named YYYY-MM-DD.jsonl."""
     log_action(
         logs_dir=tmp_path,
         actor="gmail_watcher",
@@ -14,9 +26,9 @@ def test_log_action_creates_daily_log_file(tmp_path):
         result="action_file_created",
     )
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    log_file = tmp_path / f"{today}.json"
+    log_file = tmp_path / f"{today}.jsonl"
     assert log_file.exists()
-    entries = json.loads(log_file.read_text())
+    entries = [orjson.loads(line) for line in log_file.read_bytes().splitlines() if line]
     assert len(entries) == 1
     assert entries[0]["actor"] == "gmail_watcher"
     assert entries[0]["action"] == "email_detected"
@@ -24,24 +36,31 @@ def test_log_action_creates_daily_log_file(tmp_path):
 
 def test_log_action_appends_to_existing(tmp_path):
     """log_action should append to existing daily log, not overwrite."""
-    from src.utils import log_action
     log_action(logs_dir=tmp_path, actor="a", action="first", source="s", result="r")
     log_action(logs_dir=tmp_path, actor="b", action="second", source="s", result="r")
     today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-    entries = json.loads((tmp_path / f"{today}.json").read_text())
+    log_file = tmp_path / f"{today}.jsonl"
+    entries = [orjson.loads(line) for line in log_file.read_bytes().splitlines() if line]
+    assert len(entries) == 2
+
+
+def test_read_log_entries_accepts_legacy_json_array(tmp_path):
+    """read_log_entries should still load pre-NDJSON daily logs (JSON arrays)."""
+    legacy = tmp_path / "2026-01-01.json"
+    legacy.write_text('[{"action": "email_sent"}, {"action": "plan_created"}]')
+    entries = read_log_entries(legacy)
     assert len(entries) == 2
+    assert entries[0]["action"] == "email_sent"
 
 
 def test_slugify():
     """slugify should produce filesystem-safe names."""
-    from src.utils import slugify
     assert slugify("Re: Invoice #1234!") == "re-invoice-1234"
     assert slugify("  Hello World  ") == "hello-world"
 
 
 def test_parse_frontmatter_extracts_yaml(tmp_path):
     """parse_frontmatter should extract YAML between --- delimiters."""
-    from src.utils import parse_frontmatter
     f = tmp_path / "test.md"
     f.write_text("---\naction: reply\nto: bob@test.com\nsubject: \"Re: Hello\"\n---\n\n# Plan\nSome content.")
     result = parse_frontmatter(f)
@@ -52,7 +71,6 @@ def test_parse_frontmatter_extracts_yaml(tmp_path):
 
 def test_parse_frontmatter_returns_empty_on_no_frontmatter(tmp_path):
     """parse_frontmatter should return empty dict when no YAML block exists."""
-    from src.utils import parse_frontmatter
     f = tmp_path / "test.md"
     f.write_text("# Just a heading\nNo frontmatter here.")
     result = parse_frontmatter(f)
@@ -61,7 +79,6 @@ def test_parse_frontmatter_returns_empty_on_no_frontmatter(tmp_path):
 
 def test_extract_reply_block(tmp_path):
     """extract_reply_block should return text between BEGIN/END REPLY markers."""
-    from src.utils import extract_reply_block
     f = tmp_path / "plan.md"
     f.write_text(
         "---\naction: reply\n---\n\n# Plan\n\n## Reply Draft\n"
@@ -73,7 +90,6 @@ def test_extract_reply_block(tmp_path):
 
 def test_extract_reply_block_returns_none_when_missing(tmp_path):
     """extract_reply_block should return None when no reply block exists."""
-    from src.utils import extract_reply_block
     f = tmp_path / "plan.md"
     f.write_text("---\naction: reply\n---\n\n# Plan\nNo reply block here.")
     result = extract_reply_block(f)
@@ -82,20 +98,17 @@ def test_extract_reply_block_returns_none_when_missing(tmp_path):
 
 def test_extract_confidence_parses_valid_score():
     """extract_confidence should parse a float from ## Confidence section."""
-    from src.utils import extract_confidence
     response = "## Analysis\nSome analysis.\n\n## Confidence\n0.85\n\n## Recommended Actions\n1. Reply"
     assert extract_confidence(response) == 0.85
 
 
 def test_extract_confidence_returns_zero_when_missing():
     """extract_confidence should return 0.0 when ## Confidence section is absent."""
-    from src.utils import extract_confidence
     response = "## Analysis\nSome analysis.\n\n## Recommended Actions\n1. Reply"
     assert extract_confidence(response) == 0.0
 
 
 def test_extract_confidence_returns_zero_for_invalid_value():
     """extract_confidence should return 0.0 when confidence value is not a number."""
-    from src.utils import extract_confidence
     response = "## Analysis\nSome analysis.\n\n## Confidence\nhigh\n\n## Recommended Actions\n1. Reply"
     assert extract_confidence(response) == 0.0
@@ -1,30 +1,23 @@
 """Tests for vault sync — git-based cloud/local synchronization."""
-import subprocess
+import shutil
 from pathlib import Path
-from unittest.mock import patch, MagicMock
 
 import pytest
+from dulwich.repo import Repo
 
 
 @pytest.fixture
-def vault(tmp_path):
+def vault(tmp_path, vault_template):
     """Create a vault directory structure."""
-    for folder in ["Needs_Action", "Pending_Approval", "Approved", "Rejected", "Done"]:
-        (tmp_path / folder).mkdir()
+    shutil.copytree(vault_template, tmp_path, dirs_exist_ok=True)
     return tmp_path
 
 
 @pytest.fixture
-def git_vault(vault):
+def git_vault(tmp_path, git_vault_template):
     """Create a vault that is also a git repo."""
-    subprocess.run(["git", "init"], cwd=str(vault), capture_output=True)
-    subprocess.run(["git", "config", "user.email", "test@test.com"], cwd=str(vault), capture_output=True)
-    subprocess.run(["git", "config", "user.name", "Test"], cwd=str(vault), capture_output=True)
-    # Initial commit so we have a HEAD
-    (vault / ".gitkeep").write_text("")
-    subprocess.run(["git", "add", "-A"], cwd=str(vault), capture_output=True)
-    subprocess.run(["git", "commit", "-m", "init"], cwd=str(vault), capture_output=True)
-    return vault
+    shutil.copytree(git_vault_template, tmp_path, dirs_exist_ok=True)
+    return tmp_path
 
 
 def test_is_git_repo_true(git_vault):
@@ -89,11 +82,9 @@ def test_push_vault_commits_changes(git_vault):
     result = push_vault(git_vault, "test sync push")
     assert result is True
     # Verify committed
-    log = subprocess.run(
-        ["git", "log", "-1", "--format=%s"],
-        cwd=str(git_vault), capture_output=True, text=True,
-    )
-    assert "test sync push" in log.stdout
+    with Repo(str(git_vault)) as repo:
+        message = repo[repo.head()].message.decode("utf-8")
+    assert "test sync push" in message
 
 
 def test_push_vault_no_changes(git_vault):
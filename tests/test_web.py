@@ -1,30 +1,48 @@
 """Tests for the FastAPI web dashboard."""
 import json
+import os
+import shutil
 from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
 
-from src.web import app, create_app
+from src.web import create_app
 
 
-@pytest.fixture()
-def vault(tmp_path):
-    """Create a minimal vault structure for testing."""
-    for folder in [
-        "Inbox", "Needs_Action", "Plans", "Pending_Approval",
-        "Approved", "Done", "Logs", "Incoming_Files", "Rejected",
-        "In_Progress", "Updates",
-    ]:
-        (tmp_path / folder).mkdir()
-    create_app(tmp_path)
+@pytest.fixture(scope="session")
+def web_vault_template(tmp_path_factory, vault_template):
+    """Session vault template extended with the web-only folders."""
+    template = tmp_path_factory.mktemp("web_vault_template", numbered=False)
+    shutil.copytree(vault_template, template, dirs_exist_ok=True)
+    for folder in ("In_Progress", "Updates"):
+        os.mkdir(template / folder)
+    return template
+
+
+@pytest.fixture(scope="session")
+def app(web_vault_template):
+    """One app instance for the session; tests swap app.state.vault."""
+    return create_app(web_vault_template)
+
+
+@pytest.fixture(autouse=True)
+def vault(tmp_path, web_vault_template, app):
+    """Clone the vault template and point the app at it."""
+    shutil.copytree(web_vault_template, tmp_path, dirs_exist_ok=True)
+    app.state.vault = tmp_path
     return tmp_path
 
 
-@pytest.fixture()
-def client(vault):
-    """Return a TestClient for the FastAPI app."""
-    return TestClient(app)
+@pytest.fixture(scope="session")
+def client(app):
+    """One TestClient for the whole session — app startup runs once.
+
+    Per-test isolation comes from the autouse vault fixture repointing
+    app.state.vault at a fresh tmp_path before each test.
+    """
+    with TestClient(app) as c:
+        yield c
 
 
 # --- Dashboard page tests ---
@@ -75,6 +93,14 @@ def test_dashboard_shows_needs_action_items(client, vault):
     assert "Urgent request" in resp.text
 
 
+def test_dashboard_reads_crlf_frontmatter(client, vault):
+    (vault / "Needs_Action" / "email-crlf.md").write_bytes(
+        b"---\r\ntype: email\r\nsubject: Windows line endings\r\n---\r\n"
+    )
+    resp = client.get("/")
+    assert "Windows line endings" in resp.text
+
+
 def test_dashboard_shows_recent_activity(client, vault):
     log_entry = [{
         "timestamp": "2026-02-17T10:30:00Z",
@@ -83,7 +109,7 @@ def test_dashboard_shows_recent_activity(client, vault):
         "source": "plan-test.md",
         "result": "reply_to:client@example.com",
     }]
-    (vault / "Logs" / "2026-02-17.json").write_text(json.dumps(log_entry))
+    (vault / "Logs" / "2026-02-17.jsonl").write_text(json.dumps(log_entry[0]) + "\n")
     resp = client.get("/")
     assert "email_sent" in resp.text
 
@@ -113,6 +139,15 @@ def test_api_pending_empty(client):
     assert resp.json()["approvals"] == []
 
 
+def test_api_pending_empty_with_domain_subdirs(client, vault):
+    """The pre-created email/file/social subdirs alone don't count as pending."""
+    for domain in ("email", "file", "social"):
+        (vault / "Pending_Approval" / domain).mkdir()
+    resp = client.get("/api/pending")
+    assert resp.status_code == 200
+    assert resp.json()["approvals"] == []
+
+
 def test_api_pending_with_items(client, vault):
     (vault / "Pending_Approval" / "plan-abc.md").write_text("---\nstatus: pending\n---\n")
     resp = client.get("/api/pending")
@@ -128,7 +163,7 @@ def test_api_activity_empty(client):
 
 def test_api_activity_with_entries(client, vault):
     entries = [{"timestamp": "2026-02-17T10:00:00Z", "action": "test", "source": "x", "result": "ok"}]
-    (vault / "Logs" / "2026-02-17.json").write_text(json.dumps(entries))
+    (vault / "Logs" / "2026-02-17.jsonl").write_text("\n".join(json.dumps(e) for e in entries) + "\n")
     resp = client.get("/api/activity")
     data = resp.json()
     assert len(data["activity"]) == 1
@@ -169,9 +204,9 @@ def test_approve_creates_log_entry(client, vault):
     src.write_text("test")
     client.post("/approve/plan-log.md", follow_redirects=False)
     # Check log was created
-    log_files = list((vault / "Logs").glob("*.json"))
+    log_files = list((vault / "Logs").glob("*.jsonl"))
     assert len(log_files) >= 1
-    entries = json.loads(log_files[0].read_text())
+    entries = [json.loads(line) for line in log_files[0].read_text().splitlines() if line]
     assert any(e["action"] == "approved" for e in entries)
 
 
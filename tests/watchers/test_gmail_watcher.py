@@ -1,13 +1,22 @@
 import json
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 import pytest
 
 
+@pytest.fixture(scope="session")
+def _gmail_service():
+    """One MagicMock tree per session — the users().messages() chains
+    allocate a child mock per attribute/call, so reuse them across tests."""
+    return MagicMock()
+
+
 @pytest.fixture
-def mock_gmail_service():
-    service = MagicMock()
-    return service
+def mock_gmail_service(_gmail_service):
+    # Recursive reset drops per-test return values and call records while
+    # keeping the already-built child mock tree.
+    _gmail_service.reset_mock(return_value=True, side_effect=True)
+    return _gmail_service
 
 
 @pytest.fixture